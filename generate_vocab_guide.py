@@ -6,302 +6,161 @@ Parses responses.json and generates an HTML vocabulary guide
 similar to episode-guide.html format.
 """
 
+import hashlib
 import json
+import os
+import pickle
 import re
+import tempfile
+from html import escape
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
+from string import Template
+from typing import Iterator, NamedTuple
 
+try:
+    import ijson
+except ImportError:  # optional: stream responses when available
+    ijson = None
 
-def clean_response_text(text: str) -> str:
-    """Remove model prompt phrases like 'Of course', 'Absolutely', etc."""
-    # Patterns to remove at the beginning of responses
-    patterns_to_remove = [
-        r"^Of course\.?\s*",
-        r"^Absolutely\.?\s*",
-        r"^No problem\.?\s*",
-        r"^You got it\.?\s*",
-        r"^Sure\.?\s*",
-        r"^Certainly\.?\s*",
-        r"^Here (?:is|are) .*?:\s*",
-        r"^Let's continue.*?\.\s*",
-        r"^Let's keep going.*?\.\s*",
-        r"^Let's pick up where we left off.*?\.\s*",
-        r"^My apologies.*?\.\s*",
-        r"^Apologies for.*?\.\s*",
-    ]
-    
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.MULTILINE)
-    
-    return text.strip()
 
+# Phrases to remove at the beginning of responses. Plain literals are checked
+# with startswith; only the phrases with variable text need a regex.
+_LITERAL_PREFIXES = ('of course', 'absolutely', 'no problem', 'you got it', 'sure', 'certainly')
+_LITERAL_PREFIX_SPAN = max(len(p) for p in _LITERAL_PREFIXES)
+_LEAD_STRIP_RE = re.compile(
+    r"^(?:Here (?:is|are) .*?:"
+    r"|Let's (?:continue|keep going|pick up where we left off).*?\."
+    r"|My apologies.*?\."
+    r"|Apologies for.*?\.)\s*",
+    re.IGNORECASE
+)
 
-def parse_vocab_entry(line: str) -> dict | None:
-    """Parse a vocabulary entry line into word, mnemonic, and definition."""
-    # Pattern: Word - Mnemonic: ... Definition: ...
-    # Or: Word - Mnemonic: ... \n\nDefinition: ...
-    
-    # Try to match the pattern with Definition on the same line
-    match = re.match(
-        r'^([A-Za-z\s]+)\s*-\s*Mnemonic:\s*(.+?)\s*Definition:\s*(.+?)\.?$',
-        line.strip(),
-        re.IGNORECASE
-    )
-    
-    if match:
-        return {
-            'word': match.group(1).strip(),
-            'mnemonic': match.group(2).strip().rstrip('.'),
-            'definition': match.group(3).strip().rstrip('.')
-        }
-    
-    # Try simpler pattern without "Definition:" prefix
-    match = re.match(
-        r'^([A-Za-z\s]+)\s*-\s*Mnemonic:\s*(.+?)$',
-        line.strip(),
-        re.IGNORECASE
-    )
-    
-    if match:
-        return {
-            'word': match.group(1).strip(),
-            'mnemonic': match.group(2).strip().rstrip('.'),
-            'definition': ''
-        }
-    
-    return None
+# Patterns used by parse_response, compiled once at import time
+_GROUP_SPLIT_RE = re.compile(r'Group\s+(\d+)')
+_WORD_MNEMONIC_RE = re.compile(r'^([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*-\s*Mnemonic:\s*(.+)$', re.IGNORECASE)
+_WORD_DEF_RE = re.compile(r'^([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*-\s*(?!Mnemonic)(.+)$', re.IGNORECASE)
+_INLINE_DEF_RE = re.compile(r'^(.*?)\s*Definition:\s*(.+?)\.?\s*$', re.IGNORECASE)
 
+# Line patterns used by parse_vocab_entry
+_ENTRY_WITH_DEF_RE = re.compile(r'^([A-Za-z\s]+)\s*-\s*Mnemonic:\s*(.+?)\s*Definition:\s*(.+?)\.?$', re.IGNORECASE)
+_ENTRY_MNEMONIC_ONLY_RE = re.compile(r'^([A-Za-z\s]+)\s*-\s*Mnemonic:\s*(.+?)$', re.IGNORECASE)
 
-def parse_response(text: str) -> list[dict]:
-    """Parse a response text to extract groups and vocabulary entries."""
-    text = clean_response_text(text)
-    groups = []
-    
-    # Split by group headers
-    group_pattern = r'Group\s+(\d+)'
-    parts = re.split(group_pattern, text)
-    
-    # parts will be: [preamble, group_num, content, group_num, content, ...]
-    i = 1
-    while i < len(parts) - 1:
-        group_num = int(parts[i])
-        group_content = parts[i + 1]
-        
-        entries = []
-        lines = group_content.strip().split('\n')
-        
-        current_word = None
-        current_mnemonic = None
-        current_definition = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check if this is a word entry with mnemonic (Groups 1-30 format)
-            # Pattern: Word - Mnemonic: ... Definition: ...
-            word_mnemonic_match = re.match(r'^([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*-\s*Mnemonic:\s*(.+)$', line, re.IGNORECASE)
-            
-            # Check if this is a word entry with definition first (Groups 31-34 format)
-            # Pattern: word - Definition text.
-            word_def_match = re.match(r'^([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*-\s*(?!Mnemonic)(.+)$', line, re.IGNORECASE)
-            
-            if word_mnemonic_match:
-                # Save previous entry if exists
-                if current_word and (current_definition or current_mnemonic):
-                    entries.append({
-                        'word': current_word,
-                        'mnemonic': current_mnemonic or '',
-                        'definition': current_definition or ''
-                    })
-                
-                current_word = word_mnemonic_match.group(1).strip()
-                mnemonic_and_maybe_def = word_mnemonic_match.group(2).strip()
-                
-                # Check if definition is on same line
-                def_match = re.search(r'Definition:\s*(.+?)\.?$', mnemonic_and_maybe_def, re.IGNORECASE)
-                if def_match:
-                    current_mnemonic = re.sub(r'\s*Definition:.*$', '', mnemonic_and_maybe_def, flags=re.IGNORECASE).strip().rstrip('.')
-                    current_definition = def_match.group(1).strip().rstrip('.')
-                else:
-                    current_mnemonic = mnemonic_and_maybe_def.rstrip('.')
-                    current_definition = None
-            
-            # Check if this is a standalone Mnemonic line (Groups 31-34 format)
-            elif line.lower().startswith('mnemonic:'):
-                mnemonic_text = re.sub(r'^mnemonic:\s*', '', line, flags=re.IGNORECASE)
-                current_mnemonic = mnemonic_text.strip().rstrip('.')
-            
-            # Check if this is a standalone definition line
-            elif line.lower().startswith('definition:'):
-                def_text = re.sub(r'^definition:\s*', '', line, flags=re.IGNORECASE)
-                current_definition = def_text.strip().rstrip('.')
-            
-            # Check for word - definition format (Groups 31-34 style)
-            # Only match if we don't have a current word being built
-            elif word_def_match and current_word is None:
-                # Save any previous entry
-                if current_word and (current_definition or current_mnemonic):
-                    entries.append({
-                        'word': current_word,
-                        'mnemonic': current_mnemonic or '',
-                        'definition': current_definition or ''
-                    })
-                
-                current_word = word_def_match.group(1).strip()
-                current_definition = word_def_match.group(2).strip().rstrip('.')
-                current_mnemonic = None
-            
-            # Handle case where we have a current word and encounter a new word-def pattern
-            elif word_def_match and current_word is not None:
-                # Save current entry
-                entries.append({
-                    'word': current_word,
-                    'mnemonic': current_mnemonic or '',
-                    'definition': current_definition or ''
-                })
-                
-                # Start new entry
-                current_word = word_def_match.group(1).strip()
-                current_definition = word_def_match.group(2).strip().rstrip('.')
-                current_mnemonic = None
-        
-        # Don't forget the last entry
-        if current_word and (current_definition or current_mnemonic):
-            entries.append({
-                'word': current_word,
-                'mnemonic': current_mnemonic or '',
-                'definition': current_definition or ''
-            })
-        
-        if entries:
-            groups.append({
-                'number': group_num,
-                'entries': entries
-            })
-        
-        i += 2
-    
-    return groups
 
+class Entry(NamedTuple):
+    """A vocabulary word with its mnemonic and definition, ready for HTML output."""
+    word: str
+    mnemonic: str
+    definition: str
 
-def generate_html(all_groups: list[dict]) -> str:
-    """Generate the complete HTML document."""
-    
-    # Sort groups by number
-    all_groups.sort(key=lambda x: x['number'])
-    
-    # Calculate total words
-    total_words = sum(len(g['entries']) for g in all_groups)
-    
-    # Define episodes (groups of groups)
-    episodes = [
-        {'name': 'Episode 1: Groups 1–4', 'desc': 'Foundation vocabulary', 'groups': range(1, 5)},
-        {'name': 'Episode 2: Groups 5–9', 'desc': 'Building blocks', 'groups': range(5, 10)},
-        {'name': 'Episode 3: Groups 10–14', 'desc': 'Advanced concepts', 'groups': range(10, 15)},
-        {'name': 'Episode 4: Groups 15–19', 'desc': 'Expanding horizons', 'groups': range(15, 20)},
-        {'name': 'Episode 5: Groups 20–24', 'desc': 'Deepening knowledge', 'groups': range(20, 25)},
-        {'name': 'Episode 6: Groups 25–29', 'desc': 'Mastery level', 'groups': range(25, 30)},
-        {'name': 'Episode 7: Groups 30–34', 'desc': 'Expert vocabulary', 'groups': range(30, 35)},
-    ]
-    
-    # Create group lookup
-    group_lookup = {g['number']: g for g in all_groups}
-    
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>GRE Vocabulary - Complete Reference</title>
-  <style>
-    * {{
+
+class Group(NamedTuple):
+    """A numbered group of vocabulary entries."""
+    number: int
+    entries: list[Entry]
+
+
+# Episodes (groups of groups): first group, end group (exclusive), description
+EPISODES = [
+    (1, 5, 'Foundation vocabulary'),
+    (5, 10, 'Building blocks'),
+    (10, 15, 'Advanced concepts'),
+    (15, 20, 'Expanding horizons'),
+    (20, 25, 'Deepening knowledge'),
+    (25, 30, 'Mastery level'),
+    (30, 35, 'Expert vocabulary'),
+]
+
+
+# Static stylesheet for the generated guide
+_CSS = """    * {
       margin: 0;
       padding: 0;
       box-sizing: border-box;
-    }}
+    }
     
-    body {{
+    body {
       font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
       line-height: 1.6;
       color: #e8e6f0;
       background: linear-gradient(135deg, #2d3561 0%, #3d2d52 100%);
       min-height: 100vh;
       padding: 20px;
-    }}
+    }
     
-    .container {{
+    .container {
       max-width: 1200px;
       margin: 0 auto;
       background: #1e1e2e;
       border-radius: 12px;
       box-shadow: 0 20px 60px rgba(0,0,0,0.5);
       overflow: hidden;
-    }}
+    }
     
-    header {{
+    header {
       background: #b4a7d6;
       color: #1e1e2e;
       padding: 40px;
       text-align: center;
-    }}
+    }
     
-    header h1 {{
+    header h1 {
       font-size: 2.5em;
       margin-bottom: 10px;
       font-weight: 700;
-    }}
+    }
     
-    header p {{
+    header p {
       font-size: 1.2em;
       opacity: 0.85;
-    }}
+    }
     
-    .toc {{
+    .toc {
       background: #252535;
       padding: 30px 40px;
       border-bottom: 3px solid #8b9dc3;
-    }}
+    }
     
-    .toc h2 {{
+    .toc h2 {
       color: #b4a7d6;
       margin-bottom: 20px;
       font-size: 1.8em;
-    }}
+    }
     
-    .toc-episodes {{
+    .toc-episodes {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
       gap: 15px;
-    }}
+    }
     
-    .toc-episode {{
+    .toc-episode {
       background: #2a2a3e;
       padding: 15px 20px;
       border-radius: 8px;
       border-left: 4px solid #8b9dc3;
       transition: transform 0.2s, box-shadow 0.2s;
-    }}
+    }
     
-    .toc-episode:hover {{
+    .toc-episode:hover {
       transform: translateX(5px);
       box-shadow: 0 4px 12px rgba(139, 157, 195, 0.3);
-    }}
+    }
     
-    .toc-episode h3 {{
+    .toc-episode h3 {
       color: #a8c0ff;
       margin-bottom: 10px;
       font-size: 1.2em;
-    }}
+    }
     
-    .toc-episode ul {{
+    .toc-episode ul {
       list-style: none;
       display: flex;
       flex-wrap: wrap;
       gap: 8px;
-    }}
+    }
     
-    .toc-episode a {{
+    .toc-episode a {
       color: #deb4e8;
       text-decoration: none;
       font-size: 0.9em;
@@ -309,104 +168,104 @@ def generate_html(all_groups: list[dict]) -> str:
       background: #353545;
       border-radius: 4px;
       transition: background 0.2s;
-    }}
+    }
     
-    .toc-episode a:hover {{
+    .toc-episode a:hover {
       background: #8b9dc3;
       color: #1e1e2e;
-    }}
+    }
     
-    .episode {{
+    .episode {
       padding: 40px;
       border-bottom: 2px solid #2a2a3e;
-    }}
+    }
     
-    .episode:last-child {{
+    .episode:last-child {
       border-bottom: none;
-    }}
+    }
     
-    .episode-header {{
+    .episode-header {
       text-align: center;
       margin-bottom: 30px;
       padding-bottom: 20px;
       border-bottom: 3px solid #8b9dc3;
-    }}
+    }
     
-    .episode-header h2 {{
+    .episode-header h2 {
       color: #a8c0ff;
       font-size: 2em;
       margin-bottom: 10px;
-    }}
+    }
     
-    .episode-header p {{
+    .episode-header p {
       color: #b4a7d6;
       font-size: 1.1em;
-    }}
+    }
     
-    .group {{
+    .group {
       margin-bottom: 40px;
       background: #252535;
       border-radius: 8px;
       padding: 20px;
       border-left: 5px solid #deb4e8;
-    }}
+    }
     
-    .group-title {{
+    .group-title {
       color: #deb4e8;
       font-size: 1.5em;
       margin-bottom: 15px;
       font-weight: 600;
-    }}
+    }
     
-    table {{
+    table {
       width: 100%;
       border-collapse: collapse;
       background: #2a2a3e;
       border-radius: 6px;
       overflow: hidden;
-    }}
+    }
     
-    th {{
+    th {
       background: #b4a7d6;
       color: #1e1e2e;
       padding: 12px;
       text-align: left;
       font-weight: 600;
       font-size: 1.1em;
-    }}
+    }
     
-    td {{
+    td {
       padding: 10px 12px;
       border-bottom: 1px solid #353545;
       color: #e8e6f0;
-    }}
+    }
     
-    tr:last-child td {{
+    tr:last-child td {
       border-bottom: none;
-    }}
+    }
     
-    tr:hover {{
+    tr:hover {
       background: #2f2f45;
-    }}
+    }
     
-    td:first-child {{
+    td:first-child {
       font-weight: 600;
       color: #a8c0ff;
       width: 20%;
-    }}
+    }
     
-    td:nth-child(2) {{
+    td:nth-child(2) {
       color: #c9c4d9;
       width: 50%;
       font-style: italic;
-    }}
+    }
     
-    td:last-child {{
+    td:last-child {
       color: #e8e6f0;
       width: 30%;
-    }}
+    }
     
-    .back-to-top {{
+    .back-to-top {
       position: fixed;
       bottom: 30px;
       right: 30px;
@@ -423,95 +282,272 @@ def generate_html(all_groups: list[dict]) -> str:
       box-shadow: 0 4px 12px rgba(139, 157, 195, 0.4);
       transition: transform 0.2s;
       font-weight: bold;
-    }}
+    }
     
-    .back-to-top:hover {{
+    .back-to-top:hover {
       transform: scale(1.1);
-    }}
+    }
     
-    @media (max-width: 768px) {{
-      body {{
+    @media (max-width: 768px) {
+      body {
         padding: 10px;
-      }}
+      }
       
-      header {{
+      header {
         padding: 20px;
-      }}
+      }
       
-      header h1 {{
+      header h1 {
         font-size: 1.8em;
-      }}
+      }
       
-      .toc, .episode {{
+      .toc, .episode {
         padding: 20px;
-      }}
+      }
       
-      .toc-episodes {{
+      .toc-episodes {
         grid-template-columns: 1fr;
-      }}
+      }
       
-      td:nth-child(2) {{
+      td:nth-child(2) {
         display: none;
-      }}
+      }
       
-      td:first-child {{
+      td:first-child {
         width: 40%;
-      }}
+      }
       
-      td:last-child {{
+      td:last-child {
         width: 60%;
-      }}
-    }}
+      }
+    }"""
+
+# Document head up to the start of the table of contents
+_HEAD_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>GRE Vocabulary - Complete Reference</title>
+  <style>
+$css
   </style>
 </head>
 <body>
   <div class="container">
     <header>
       <h1>GRE Vocabulary Reference</h1>
-      <p>Complete collection of {total_words} essential words across {len(all_groups)} groups</p>
+      <p>Complete collection of $total_words essential words across $group_count groups</p>
     </header>
     
     <nav class="toc" id="toc">
       <h2>📚 Table of Contents</h2>
       <div class="toc-episodes">
-'''
+""")
+
+
+def make_entry(word: str, mnemonic: str, definition: str) -> Entry:
+    """Build an Entry with the word title-cased and the text fields HTML-escaped."""
+    return Entry(word.title(), escape(mnemonic, quote=False), escape(definition, quote=False))
+
+
+def clean_response_text(text: str) -> str:
+    """Remove model prompt phrases like 'Of course', 'Absolutely', etc."""
+    # Repeat until stable so stacked phrases ("Of course. Here is ...:") all go
+    text = text.lstrip()
+    while True:
+        head = text[:_LITERAL_PREFIX_SPAN].lower()
+        for prefix in _LITERAL_PREFIXES:
+            # Require a word boundary so e.g. "Surely" is left alone
+            if head.startswith(prefix) and not text[len(prefix):len(prefix) + 1].isalnum():
+                text = text[len(prefix):].removeprefix('.').lstrip()
+                break
+        else:
+            stripped = _LEAD_STRIP_RE.sub("", text, count=1)
+            if stripped == text:
+                break
+            text = stripped
+    
+    return text.strip()
+
+
+def parse_vocab_entry(line: str) -> Entry | None:
+    """Parse a vocabulary entry line into word, mnemonic, and definition."""
+    # Pattern: Word - Mnemonic: ... Definition: ...
+    # Or: Word - Mnemonic: ... \n\nDefinition: ...
+    
+    # Try to match the pattern with Definition on the same line
+    match = _ENTRY_WITH_DEF_RE.match(line.strip())
+    
+    if match:
+        return make_entry(
+            match.group(1).strip(),
+            match.group(2).strip().rstrip('.'),
+            match.group(3).strip().rstrip('.')
+        )
+    
+    # Try simpler pattern without "Definition:" prefix
+    match = _ENTRY_MNEMONIC_ONLY_RE.match(line.strip())
+    
+    if match:
+        return make_entry(
+            match.group(1).strip(),
+            match.group(2).strip().rstrip('.'),
+            ''
+        )
+    
+    return None
+
+
+def parse_response(text: str) -> list[Group]:
+    """Parse a response text to extract groups and vocabulary entries."""
+    text = clean_response_text(text)
+    groups = []
+    
+    def save_entry(keep_empty=False):
+        """Record the entry being built, if it has a mnemonic or definition (or keep_empty)."""
+        if current_word and (keep_empty or current_definition or current_mnemonic):
+            entries.append(make_entry(current_word, current_mnemonic or '', current_definition or ''))
+    
+    # Locate group headers; each group's content runs up to the next header
+    headers = list(_GROUP_SPLIT_RE.finditer(text))
+    
+    for i, header in enumerate(headers):
+        group_num = int(header.group(1))
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        group_content = text[header.end():end]
+        
+        entries = []
+        lines = group_content.strip().split('\n')
+        
+        current_word = None
+        current_mnemonic = None
+        current_definition = None
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            lower_line = line.lower()
+            
+            # Check if this is a word entry with mnemonic (Groups 1-30 format)
+            # Pattern: Word - Mnemonic: ... Definition: ...
+            # Both word patterns need a hyphen, so skip the regexes when there is none
+            has_hyphen = '-' in line
+            word_mnemonic_match = _WORD_MNEMONIC_RE.match(line) if has_hyphen else None
+            
+            # Check if this is a word entry with definition first (Groups 31-34 format)
+            # Pattern: word - Definition text.
+            # Only needed when no earlier branch below will take the line
+            word_def_match = None
+            if (has_hyphen and not word_mnemonic_match
+                    and not lower_line.startswith(('mnemonic:', 'definition:'))):
+                word_def_match = _WORD_DEF_RE.match(line)
+            
+            if word_mnemonic_match:
+                save_entry()
+                
+                current_word = word_mnemonic_match.group(1).strip()
+                mnemonic_and_maybe_def = word_mnemonic_match.group(2).strip()
+                
+                # Check if definition is on same line
+                def_match = _INLINE_DEF_RE.match(mnemonic_and_maybe_def)
+                if def_match:
+                    current_mnemonic = def_match.group(1).strip().rstrip('.')
+                    current_definition = def_match.group(2).strip().rstrip('.')
+                else:
+                    current_mnemonic = mnemonic_and_maybe_def.rstrip('.')
+                    current_definition = None
+            
+            # Check if this is a standalone Mnemonic line (Groups 31-34 format)
+            elif lower_line.startswith('mnemonic:'):
+                mnemonic_text = line[len('mnemonic:'):]
+                current_mnemonic = mnemonic_text.strip().rstrip('.')
+            
+            # Check if this is a standalone definition line
+            elif lower_line.startswith('definition:'):
+                def_text = line[len('definition:'):]
+                current_definition = def_text.strip().rstrip('.')
+            
+            # Check for word - definition format (Groups 31-34 style)
+            elif word_def_match:
+                # A new word - definition line always closes the current word,
+                # even one with neither mnemonic nor definition
+                save_entry(keep_empty=True)
+                
+                current_word = word_def_match.group(1).strip()
+                current_definition = word_def_match.group(2).strip().rstrip('.')
+                current_mnemonic = None
+        
+        # Don't forget the last entry
+        save_entry()
+        
+        if entries:
+            groups.append(Group(group_num, entries))
+    
+    return groups
+
+
+def iter_html(all_groups: list[Group]) -> Iterator[str]:
+    """Generate the complete HTML document as a sequence of chunks."""
+    
+    # Calculate total words
+    total_words = sum(len(g.entries) for g in all_groups)
+    
+    # Create group lookup
+    group_lookup = {g.number: g for g in all_groups}
+    
+    # Expand episodes into (name, description, groups present), shared by the
+    # TOC and the section loops
+    episodes = [
+        (
+            f'Episode {i}: Groups {start}–{end - 1}',
+            desc,
+            [group_lookup[gnum] for gnum in range(start, end) if gnum in group_lookup]
+        )
+        for i, (start, end, desc) in enumerate(EPISODES, 1)
+    ]
+    
+    yield _HEAD_TEMPLATE.substitute(
+        css=_CSS,
+        total_words=total_words,
+        group_count=len(all_groups)
+    )
     
     # Generate TOC
-    for episode in episodes:
-        html += f'''        <div class="toc-episode">
-          <h3>{episode['name']}</h3>
-          <p style="margin-bottom: 10px; color: #b4a7d6;">{episode['desc']}</p>
+    for name, desc, episode_groups in episodes:
+        yield f'''        <div class="toc-episode">
+          <h3>{name}</h3>
+          <p style="margin-bottom: 10px; color: #b4a7d6;">{desc}</p>
           <ul>
 '''
-        for gnum in episode['groups']:
-            if gnum in group_lookup:
-                html += f'            <li><a href="#group{gnum}">Group {gnum}</a></li>\n'
-        html += '''          </ul>
+        for group in episode_groups:
+            yield f'            <li><a href="#group{group.number}">Group {group.number}</a></li>\n'
+        yield '''          </ul>
         </div>
 '''
     
-    html += '''      </div>
+    yield '''      </div>
     </nav>
 '''
     
     # Generate episode sections
-    for episode in episodes:
-        episode_groups = [group_lookup[gnum] for gnum in episode['groups'] if gnum in group_lookup]
+    for name, desc, episode_groups in episodes:
         if not episode_groups:
             continue
         
-        html += f'''
+        yield f'''
     <section class="episode">
       <div class="episode-header">
-        <h2>{episode['name']}</h2>
-        <p>{episode['desc']}</p>
+        <h2>{name}</h2>
+        <p>{desc}</p>
       </div>
 '''
         
         for group in episode_groups:
-            html += f'''
-      <div class="group" id="group{group['number']}">
-        <h3 class="group-title">Group {group['number']}</h3>
+            yield f'''
+      <div class="group" id="group{group.number}">
+        <h3 class="group-title">Group {group.number}</h3>
         <table>
           <thead>
             <tr>
@@ -522,87 +558,180 @@ def generate_html(all_groups: list[dict]) -> str:
           </thead>
           <tbody>
 '''
-            for entry in group['entries']:
-                word = entry['word'].title()
-                mnemonic = entry.get('mnemonic', '') or ''
-                definition = entry.get('definition', '') or ''
-                
-                # Escape HTML characters
-                mnemonic = mnemonic.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                definition = definition.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                
-                html += f'            <tr><td>{word}</td><td>{mnemonic}</td><td>{definition}</td></tr>\n'
+            for entry in group.entries:
+                yield f'            <tr><td>{entry.word}</td><td>{entry.mnemonic}</td><td>{entry.definition}</td></tr>\n'
             
-            html += '''          </tbody>
+            yield '''          </tbody>
         </table>
       </div>
 '''
         
-        html += '''    </section>
+        yield '''    </section>
 '''
     
-    html += '''  </div>
+    yield '''  </div>
   
   <a href="#toc" class="back-to-top">↑</a>
 </body>
 </html>
 '''
-    
-    return html
 
 
-def main():
-    # Read responses.json
-    script_dir = Path(__file__).parent
-    responses_path = script_dir / 'responses.json'
-    output_path = script_dir / 'vocab-guide-generated.html'
-    
-    print(f"Reading {responses_path}...")
-    
-    with open(responses_path, 'r', encoding='utf-8') as f:
-        responses = json.load(f)
-    
-    print(f"Found {len(responses)} responses to parse")
-    
-    # Parse all responses
-    all_groups = []
-    group_lookup = {}  # Track groups by number to handle duplicates
+def iter_responses(path: Path) -> Iterator[str]:
+    """Yield the responses in a JSON array file one at a time."""
+    # With ijson the array is decoded incrementally; otherwise fall back to
+    # loading the whole file with json.load
+    if ijson is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+        return
+    
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'item')
+
+
+def iter_parsed(responses: Iterator[str]) -> Iterator[list[Group]]:
+    """Parse responses across worker processes, yielding results in input order."""
+    cpus = os.cpu_count() or 1
+    
+    # With one CPU or only a handful of responses, pool startup and pickling
+    # cost more than the regex work they would parallelize
+    head = list(islice(responses, 2 * cpus))
+    if cpus == 1 or len(head) < 2 * cpus:
+        yield from map(parse_response, chain(head, responses))
+        return
+    
+    # Pool.imap's task handler drains its input eagerly, so gate the feeder on
+    # a semaphore released as results are consumed; this bounds how many
+    # responses are in flight without stalling workers between batches.
+    # imap (not imap_unordered) keeps input order, which the duplicate-group
+    # handling relies on.
+    # Imported here so serial runs don't pay for loading multiprocessing
+    import threading
+    from multiprocessing import Pool
+    
+    in_flight = 4 * cpus
+    slots = threading.Semaphore(in_flight)
+    stopped = threading.Event()
+    
+    def feed():
+        for response in chain(head, responses):
+            slots.acquire()
+            if stopped.is_set():
+                return
+            yield response
+    
+    with Pool() as pool:
+        try:
+            for groups in pool.imap(parse_response, feed(), chunksize=4):
+                slots.release()
+                yield groups
+        finally:
+            # Unblock the feeder so the pool can shut down if we stop early
+            stopped.set()
+            slots.release(in_flight)
+
+
+def parse_all_responses(responses_path: Path) -> list[Group]:
+    """Parse every response, keeping the most complete copy of each group, ordered by number."""
+    groups_by_number: dict[int, Group] = {}  # Track groups by number to handle duplicates
     
     def count_complete_entries(group):
         """Count entries that have both mnemonic and definition."""
-        return sum(1 for e in group['entries'] if e.get('mnemonic') and e.get('definition'))
+        return sum(1 for e in group.entries if e.mnemonic and e.definition)
     
-    for i, response in enumerate(responses):
-        print(f"Parsing response {i + 1}...")
-        groups = parse_response(response)
+    response_count = 0
+    for groups in iter_parsed(iter_responses(responses_path)):
+        response_count += 1
+        print(f"Parsing response {response_count}...")
         
         for group in groups:
-            group_num = group['number']
+            group_num = group.number
             complete_count = count_complete_entries(group)
+            existing = groups_by_number.get(group_num)
             
-            if group_num not in group_lookup:
+            if existing is None:
                 # First time seeing this group
-                group_lookup[group_num] = group
-                print(f"  Found Group {group_num} with {len(group['entries'])} entries ({complete_count} complete)")
+                groups_by_number[group_num] = group
+                print(f"  Found Group {group_num} with {len(group.entries)} entries ({complete_count} complete)")
             else:
                 # We've seen this group before - prefer the one with more complete entries
-                existing_complete = count_complete_entries(group_lookup[group_num])
+                existing_complete = count_complete_entries(existing)
                 if complete_count > existing_complete:
                     print(f"  Replacing Group {group_num}: {existing_complete} -> {complete_count} complete entries")
-                    group_lookup[group_num] = group
+                    groups_by_number[group_num] = group
+    
+    print(f"\nParsed {response_count} responses")
+    
+    return sorted(groups_by_number.values(), key=attrgetter('number'))
+
+
+def load_cached_groups(cache_path: Path) -> list[Group] | None:
+    """Load groups written by save_cached_groups, or None if missing or unreadable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            raw_groups = pickle.load(f)
+        return [Group(number, [Entry(*e) for e in entries]) for number, entries in raw_groups]
+    except Exception:
+        # Missing, corrupt or stale cache file; fall back to a fresh parse
+        return None
+
+
+def save_cached_groups(cache_path: Path, groups: list[Group]) -> None:
+    """Pickle groups as plain tuples, replacing the cache file atomically.
+    
+    Other cache files in the same directory are stale once this one is
+    written, so they are removed.
+    """
+    # Plain tuples keep the pickle independent of the module Entry/Group live
+    # in (__main__ when run as a script), and writing to a temp file first
+    # means an interrupted run never leaves a truncated cache behind
+    raw_groups = [(g.number, [tuple(e) for e in g.entries]) for g in groups]
+    cache_path.parent.mkdir(exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(raw_groups, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    
+    for stale_path in cache_path.parent.glob('*.pkl'):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+
+
+def main():
+    # Read responses.json
+    script_dir = Path(__file__).parent
+    responses_path = script_dir / 'responses.json'
+    output_path = script_dir / 'vocab-guide-generated.html'
+    cache_dir = script_dir / '.vocab_cache'
     
-    all_groups = list(group_lookup.values())
+    print(f"Reading {responses_path}...")
     
-    print(f"\nTotal: {len(all_groups)} groups")
-    print(f"Total words: {sum(len(g['entries']) for g in all_groups)}")
+    # Cache parsed groups keyed on the input and on this script, so edits to
+    # either one trigger a fresh parse
+    with open(responses_path, 'rb') as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+    digest.update(Path(__file__).read_bytes())
+    cache_path = cache_dir / f'{digest.hexdigest()}.pkl'
+    
+    all_groups = load_cached_groups(cache_path)
+    if all_groups is not None:
+        print(f"Loaded parsed groups from {cache_path}")
+    else:
+        all_groups = parse_all_responses(responses_path)
+        save_cached_groups(cache_path, all_groups)
+    
+    print(f"Total: {len(all_groups)} groups")
+    print(f"Total words: {sum(len(g.entries) for g in all_groups)}")
     
     # Generate HTML
     print(f"\nGenerating HTML...")
-    html = generate_html(all_groups)
-    
-    # Write output
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+        f.writelines(iter_html(all_groups))
     
     print(f"Generated: {output_path}")
     print("Done!")